@@ -1,102 +1,278 @@
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+import lxml.html as LH
 import time
-from typing import List, Tuple, Optional, Dict, Any
-from urllib.parse import urljoin, parse_qs, urlparse
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from typing import List, Tuple, Optional, Dict, Any, Set
+from urllib.parse import urljoin
 import pandas as pd
 import re
 from datetime import datetime
 import os
 import time
 
-# Helper function to parse ratings from restaurant card
-def _parse_rating(rating_span) -> str:
-    rating_text = "No Rating"
-    star_count = 0
-    if rating_span:
-        img_list = rating_span.find_all('img', class_='michelin-award')
-        for img in img_list:
-            src = img['src']
-            if 'bib-gourmand' in src:
-                return 'Bib Gourmand'
-            elif '1star' in src:
-                star_count += 1
-        if star_count == 1:
-            rating_text = "1 Star"
-        elif star_count == 2:
-            rating_text = "2 Stars"
-        elif star_count == 3:
-            rating_text = "3 Stars"
-
-    return rating_text
+# Number of restaurant pages fetched concurrently
+DETAIL_WORKERS = 8
+
+# On-disk HTTP cache so re-runs don't re-fetch pages (kept for one week)
+CACHE_NAME = 'michelin_cache'
+CACHE_EXPIRE_AFTER = 60 * 60 * 24 * 7
+
+# 4 DC restaurants that appear in each results page for some reason
+_BLACKLIST = frozenset({"La'Shukran", "Café Riggs", "Xiquet", "Rooster & Owl"})
+
+# Site root, prefixed to the site-relative links on results pages
+_MICHELIN_ORIGIN = "https://guide.michelin.com"
+
+# Output columns, in order
+_COLUMNS = (
+    "Name",
+    "Rating",
+    "City",
+    "Price Range",
+    "Cuisine",
+    "Description",
+    "Address",
+    "Latitude",
+    "Longitude",
+    "Michelin Website",
+    "Restaurant Website",
+    "Restaurant Telephone Number",
+    "Reservation Link",
+)
+
+# Rating label by number of star images on a card
+_STAR_RATINGS = {1: "1 Star", 2: "2 Stars", 3: "3 Stars"}
+
+# Collapses runs of whitespace in card text
+_WS_RE = re.compile(r'\s+')
+
+# scheme://host part of an absolute URL
+_ORIGIN_RE = re.compile(r'[^:/?#]+://[^/?#]*')
+
+# Latitude and longitude from the 'q' parameter of a Google Maps embed URL
+# (spaces may appear as '+', '%20' or literal whitespace around the numbers, as parse_qs would accept)
+_LATLON_RE = re.compile(
+    r'[?&]q=(?:\+|%20|\s)*(-?\d+(?:\.\d+)?)(?:\+|%20|\s)*(?:,|%2C)(?:\+|%20|\s)*(-?\d+(?:\.\d+)?)',
+    re.IGNORECASE,
+)
+
+# Michelin pages are always UTF-8, so skip encoding detection when parsing.
+# Parsers are kept per thread: a shared parser instance serializes parsing across the fetch threads.
+_parser_local = threading.local()
+
+# Helper function to get this thread's UTF-8 HTML parser, creating it on first use
+def _html_parser() -> LH.HTMLParser:
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = _parser_local.parser = LH.HTMLParser(encoding='utf-8')
+    return parser
+
+# XPath equivalent of a CSS class selector (matches whole class tokens only)
+def _has_class(class_name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+# Compiled XPaths for the results page
+_CARDS_XP = LH.etree.XPath(f"//div[{_has_class('card__menu')}]")
+# Every element a card needs (title, footers, award images, links) in a single walk of the card
+_CARD_FIELDS_XP = LH.etree.XPath(
+    ".//*["
+    f"self::h3[{_has_class('card__menu-content--title')}]"
+    f" or self::div[{_has_class('card__menu-footer--score')}]"
+    f" or self::img[{_has_class('michelin-award')}][@src][ancestor::span[{_has_class('distinction-icon')}]]"
+    " or self::a[@href]"
+    "]"
+)
+# First pagination link holding the right arrow icon (fa-angle-right)
+_NEXT_XP = LH.etree.XPath(
+    f"(//ul[{_has_class('pagination')}]//li/a[.//i[{_has_class('fa-angle-right')}]])[1]/@href",
+    smart_strings=False,
+)
+
+# Compiled XPaths for the restaurant page
+_ADDRESS_XP = LH.etree.XPath(f"(//div[{_has_class('data-sheet__block--text')}])[1]")
+_DESCRIPTION_XP = LH.etree.XPath(f"(//div[{_has_class('data-sheet__description')}])[1]")
+_WEBSITE_XP = LH.etree.XPath("(//a[@data-event='CTA_website'])[1]/@href", smart_strings=False)
+_TELEPHONE_XP = LH.etree.XPath("(//a[@data-event='CTA_tel'])[1]/@href", smart_strings=False)
+_RESERVATION_XP = LH.etree.XPath(f"(//a[{_has_class('js-restaurant-book-btn')}])[1]/@href", smart_strings=False)
+_MAP_IFRAME_SRC_XP = LH.etree.XPath("string((//iframe[contains(@src, 'google.com/maps')])[1]/@src)", smart_strings=False)
+
+# Define Request Headers once
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+# Delay between results pages adapts to server latency: half the smoothed latency, never below the floor
+_LATENCY_ALPHA = 0.3
+_MIN_PAGE_DELAY = 0.25
+_latency_lock = threading.Lock()
+_latency_ewma = None
+
+# Response hook that keeps an exponentially weighted moving average of server latency
+def _track_latency(response, *args, **kwargs):
+    global _latency_ewma
+    if getattr(response, 'from_cache', False):
+        return
+
+    latency = response.elapsed.total_seconds()
+    with _latency_lock:
+        if _latency_ewma is None:
+            _latency_ewma = latency
+        else:
+            _latency_ewma = _LATENCY_ALPHA * latency + (1 - _LATENCY_ALPHA) * _latency_ewma
+
+# Helper function to get the delay before requesting the next results page
+def _page_delay() -> float:
+    return max(_MIN_PAGE_DELAY, 0.5 * (_latency_ewma or 0.0))
+
+# Shared cached session so every request reuses pooled keep-alive connections
+_SESSION = requests_cache.CachedSession(CACHE_NAME, backend='sqlite', expire_after=CACHE_EXPIRE_AFTER)
+_SESSION.headers.update(HEADERS)
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+    ),
+))
+_SESSION.hooks['response'].append(_track_latency)
+
+# Helper function to create an empty dict of column lists
+def _empty_columns() -> Dict[str, List[Any]]:
+    return {column: [] for column in _COLUMNS}
+
+# Helper function to build a page DataFrame from column lists, with numeric coordinates on every page
+def _columns_to_frame(columns: Dict[str, List[Any]]) -> pd.DataFrame:
+    return pd.DataFrame(columns, copy=False).astype({"Latitude": "float64", "Longitude": "float64"})
+
+# Helper function to split the elements of a restaurant card into (name tag, footers, award image sources, link)
+def _parse_card_fields(card):
+    name_tag, footers, award_srcs, link = None, [], [], None
+    for element in _CARD_FIELDS_XP(card):
+        if element.tag == 'div':
+            footers.append(element)
+        elif element.tag == 'img':
+            award_srcs.append(element.get('src'))
+        elif element.tag == 'a':
+            if link is None:
+                link = element.get('href')
+        elif name_tag is None:
+            name_tag = element
+
+    return name_tag, footers, award_srcs, link
+
+# Helper function to get the stripped text of an lxml element, like BeautifulSoup's get_text(strip=True)
+def _get_text(element) -> str:
+    return "".join(text.strip() for text in element.itertext())
+
+# Helper function to parse ratings from the award image sources of a restaurant card
+def _parse_rating(img_srcs: List[str]) -> str:
+    # Stars are shown as one 1star image each, so join the sources and count in one pass
+    all_srcs = " ".join(img_srcs)
+    if 'bib-gourmand' in all_srcs:
+        return 'Bib Gourmand'
+
+    return _STAR_RATINGS.get(all_srcs.count('1star'), "No Rating")
 
 # Helper function to parse the price and cuisine from restaurant card
 def _parse_price_cuisine(footer):
-    raw_text = footer.get_text()
+    raw_text = footer.text_content()
     # Remove /n
-    cleaned_text = re.sub(r'\s+', ' ', raw_text).strip().replace(" ","").split('·')
+    cleaned_text = _WS_RE.sub(' ', raw_text).strip().replace(" ","").split('·')
     return cleaned_text[0], cleaned_text[1]
 
+# Helper function to make a pagination link absolute, only falling back to urljoin for unusual links
+def _resolve_page_url(url: str, href: str) -> str:
+    if href.startswith('?'):
+        # Query-only link: same path as the current page
+        return url.split('#', 1)[0].split('?', 1)[0] + href
+    if href.startswith(('https://', 'http://')):
+        return href
+    if href.startswith('/') and not href.startswith('//'):
+        # Root-relative link: same scheme and host as the current page
+        origin = _ORIGIN_RE.match(url)
+        if origin:
+            return origin.group(0) + href
+    return urljoin(url, href)
+
 # Helper function to parse google maps iframe in restaurant page
 def _scrape_gm_iframe_url(url: str):
-    # Parse url
-    parsed_url = urlparse(url)
-
-    # Extract the query parameters into a dictionary
-    query_params = parse_qs(parsed_url.query)
+    # The embed URL always carries the coordinates as q=<lat>,<lon>
+    lat_lon = _LATLON_RE.search(url)
 
-    if 'q' in query_params:
-        # 3. Get the value of the 'query' key and split it
-        lat_lon_string = query_params['q'][0]
-        lat_lon = lat_lon_string.split(',')
-
-        latitude = float(lat_lon[0])
-        longitude = float(lat_lon[1])
+    if lat_lon:
+        latitude = float(lat_lon.group(1))
+        longitude = float(lat_lon.group(2))
     else:
-        latitude, longitude = "", ""
+        # None rather than "" so the columns stay numeric (Parquet can't mix floats and strings)
+        latitude, longitude = None, None
 
     return latitude, longitude
 
-# Helper function to scrape data from restaurant page
-def _scrape_restaurant_page(url: str, headers: dict):
-    # Query URL
-    try:
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        print(f"\tError fetching page: {e}")
-        return {
-            "Address": "",
-            "Description": "",
-            "Coordinates": "",
-            "Website URL": ""
-        }
+# Helper function to create the restaurant page fields used when the page isn't scraped
+def _empty_restaurant_page() -> Dict[str, Any]:
+    return {
+        "Address": "",
+        "Description": "",
+        "Restaurant Website": "",
+        "Telephone Number": "",
+        "Reservation Link": "",
+        "Latitude": None,
+        "Longitude": None
+    }
 
+# Helper function to GET a page, raising requests' RequestException on failure
+def _fetch(url: str) -> requests.Response:
+    # Stream so the body of an error response is discarded without being downloaded
+    response = _SESSION.get(url, timeout=15, stream=True)
+    if not response.ok:
+        response.close()
+    response.raise_for_status()
+    return response
+
+# Helper function to run a parser in the process pool if there is one, otherwise in this thread
+def _run_parser(parse_pool: Optional[ProcessPoolExecutor], parser, *args):
+    if parse_pool is None:
+        return parser(*args)
+    return parse_pool.submit(parser, *args).result()
+
+# Helper function to parse a restaurant page (top-level and plain-data in/out so it can run in a process pool)
+def _parse_detail_html(html: bytes) -> Dict[str, Any]:
     # Initialize parser
-    soup = BeautifulSoup(response.text, 'html.parser')
+    tree = LH.fromstring(html, parser=_html_parser())
 
     # Get address
-    address_tag = soup.select_one('div.data-sheet__block--text')
-    address = address_tag.get_text(strip=True) if address_tag else ""
+    address_tags = _ADDRESS_XP(tree)
+    address = _get_text(address_tags[0]) if address_tags else ""
 
     # Get description
-    description_tag = soup.select_one('div.data-sheet__description')
-    description = description_tag.get_text(strip=True) if description_tag else ""
+    description_tags = _DESCRIPTION_XP(tree)
+    description = _get_text(description_tags[0]) if description_tags else ""
 
     # Get restaurant url
-    restaurant_website_tag = soup.find('a',{'data-event': 'CTA_website'})
-    restaurant_website = restaurant_website_tag['href'] if restaurant_website_tag else ""
+    restaurant_website_hrefs = _WEBSITE_XP(tree)
+    restaurant_website = restaurant_website_hrefs[0] if restaurant_website_hrefs else ""
 
     # Get restaurant phone number
-    restaurant_telephone_tag = soup.find('a',{'data-event': 'CTA_tel'})
-    restaurant_telephone = str.split(restaurant_telephone_tag['href'], ':')[1] if restaurant_telephone_tag else ""
+    restaurant_telephone_hrefs = _TELEPHONE_XP(tree)
+    restaurant_telephone = restaurant_telephone_hrefs[0].removeprefix('tel:') if restaurant_telephone_hrefs else ""
 
     # Get reservation link
-    reservation_link_tag = soup.find('a', class_='js-restaurant-book-btn')
-    reservation_link = reservation_link_tag['href'] if reservation_link_tag else ""
+    reservation_link_hrefs = _RESERVATION_XP(tree)
+    reservation_link = reservation_link_hrefs[0] if reservation_link_hrefs else ""
 
-    # Get coordinates
-    iframe_url = soup.select('iframe')[1]['src']
+    # Get coordinates from the first Google Maps iframe ("" if the page has none)
+    iframe_url = _MAP_IFRAME_SRC_XP(tree)
     latitude, longitude = _scrape_gm_iframe_url(iframe_url)
 
     return {
@@ -109,146 +285,221 @@ def _scrape_restaurant_page(url: str, headers: dict):
         "Longitude": longitude
     }
 
-# Helper function to scrape data from a single web page
-def _scrape_results_single_page(url: str, headers: dict) -> Tuple[List[Dict[str, str]], Optional[str]]:
-    """
-    Helper function to scrape restaurant data and find the next page URL.
-    Returns: (List of restaurant dictionaries, Next page URL or None)
-    """
-    print(f"Scraping page: {url}")
-
-    restaurant_data = []
-    next_page_url = None
+# Helper function to scrape data from restaurant page
+def _scrape_restaurant_page(url: str, parse_pool: Optional[ProcessPoolExecutor] = None):
+    # Stagger concurrent workers so they don't all hit the server at once
+    if not _SESSION.cache.contains(url=url):
+        time.sleep(random.uniform(0, 0.25))
 
+    # Query URL
     try:
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
+        response = _fetch(url)
     except requests.exceptions.RequestException as e:
-        print(f"Error fetching page: {e}")
-        return [], None
+        print(f"\tError fetching page: {e}")
+        return _empty_restaurant_page()
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    return _run_parser(parse_pool, _parse_detail_html, response.content)
+
+# Helper function to parse a results page (top-level and plain-data in/out so it can run in a process pool)
+def _parse_listing_html(html: bytes, url: str, blacklist: frozenset = _BLACKLIST) -> Tuple[List[Tuple[str, ...]], Optional[str], int]:
+    """
+    Returns: (List of (name, city, price, cuisine, rating, restaurant URL) tuples, Linked next page URL or None,
+              Number of restaurant cards on the page that are not blacklisted)
+    """
+    tree = LH.fromstring(html, parser=_html_parser())
 
     # 1. Identify all restaurant cards (The anchor tag containing all details)
     # This selector targets the main link element for each restaurant card.
-    restaurant_cards = soup.select('div.card__menu')
+    listings = []
+    for card in _CARDS_XP(tree):
+        name_tag, footer, award_srcs, link = _parse_card_fields(card)
 
-    if not restaurant_cards:
-        print("No restaurant cards found. Stopping page scrape.")
-
-    for card in restaurant_cards:
         # Parse name
-        name_tag = card.select_one('h3.card__menu-content--title')
-        name = name_tag.get_text(strip=True) if name_tag else ""
+        name = _get_text(name_tag) if name_tag is not None else ""
 
-        # Filter out 4 DC restaurants that appear in each page for some reason
-        if name in ['La\'Shukran', 'Café Riggs', 'Xiquet', 'Rooster & Owl']:
+        # Filter out blacklisted restaurants (by default the 4 DC ones that appear in each page)
+        if name in blacklist:
             continue
 
-        # Print name of restaurant being parsed
-        print(f"\t{name}")
-
         # Parse footer
-        footer = card.select('div.card__menu-footer--score')
-        city = footer[0].get_text(strip=True) if footer[0] else ""
+        city = _get_text(footer[0]) if footer else ""
         price, cuisine = _parse_price_cuisine(footer[1])
 
         # Parse rating
-        rating_span = card.select_one('span.distinction-icon')
-        rating = _parse_rating(rating_span)
+        rating = _parse_rating(award_srcs)
 
         # Parse restaurant URL
-        restaurant_url = "https://guide.michelin.com" + card.select_one('a')['href']
-        restaurant_page_data = _scrape_restaurant_page(restaurant_url, headers)
-
-        restaurant_data.append({
-            "Name": name,
-            "Rating": rating,
-            "City": city,
-            "Price Range": price,
-            "Cuisine": cuisine,
-            "Description": restaurant_page_data['Description'],
-            "Address": restaurant_page_data['Address'],
-            "Latitude": restaurant_page_data['Latitude'],
-            "Longitude": restaurant_page_data['Longitude'],
-            "Michelin Website": restaurant_url,
-            "Restaurant Website": restaurant_page_data['Restaurant Website'],
-            "Restaurant Telephone Number": restaurant_page_data['Telephone Number'],
-            "Reservation Link": restaurant_page_data['Reservation Link'],
-        })
+        restaurant_url = _MICHELIN_ORIGIN + link
 
-    # 2. Extract 'Next Page' URL (Robust Logic for Pagination)
-    pagination_links = soup.select('ul.pagination li a')
-    next_link_element = None
+        listings.append((name, city, price, cuisine, rating, restaurant_url))
 
+    # 2. Extract 'Next Page' URL (Robust Logic for Pagination)
     # Look for the link that contains the right arrow icon (fa-angle-right)
-    for link in pagination_links:
-        if link.select_one('i.fa-angle-right'):
-            next_link_element = link
-            break
+    next_hrefs = _NEXT_XP(tree)
+    relative_link = next_hrefs[0] if next_hrefs else None
 
-    if next_link_element:
-        relative_link = next_link_element.get('href')
+    if relative_link and relative_link != '#':
+        return listings, _resolve_page_url(url, relative_link), len(listings)
 
-        if relative_link and relative_link != '#':
-            new_full_url = urljoin(url, relative_link)
+    return listings, None, len(listings)
 
-            # CRITICAL CHECK: Only proceed if the new URL is genuinely different
-            if new_full_url != url:
-                next_page_url = new_full_url
-                print(f"\tPotential next URL found: {next_page_url}")
-            else:
-                print("\tNext link points to the current URL. Reached the last page.")
+# Helper function to scrape data from a single web page
+def _scrape_results_single_page(
+    url: str,
+    executor: ThreadPoolExecutor,
+    seen_urls: Set[str],
+    blacklist: frozenset = _BLACKLIST,
+    parse_pool: Optional[ProcessPoolExecutor] = None,
+    with_details: bool = True,
+) -> Tuple[pd.DataFrame, Optional[str], int]:
+    """
+    Helper function to scrape restaurant data and find the next page URL.
+    Restaurants whose URL is already in `seen_urls` are skipped; new ones are added to it.
+    Restaurant pages are only fetched when `with_details` is set.
+    Returns: (DataFrame of the page's new restaurants, Next page URL or None,
+              Number of non-blacklisted restaurant cards, counted before dedupe filtering)
+    """
+    print(f"Scraping page: {url}")
 
-    return restaurant_data, next_page_url
+    restaurant_data = _empty_columns()
+    next_page_url = None
+
+    try:
+        response = _fetch(url)
+    except requests.exceptions.RequestException as e:
+        print(f"Error fetching page: {e}")
+        return _columns_to_frame(restaurant_data), None, 0
+
+    all_listings, new_full_url, card_count = _run_parser(
+        parse_pool, _parse_listing_html, response.content, url, blacklist
+    )
+
+    if not card_count:
+        print("No restaurant cards found. Stopping page scrape.")
+
+    # Skip restaurants already scraped from an earlier page
+    listings = []
+    for listing in all_listings:
+        restaurant_url = listing[-1]
+        if restaurant_url in seen_urls:
+            continue
+        seen_urls.add(restaurant_url)
+
+        # Print name of restaurant being parsed
+        print(f"\t{listing[0]}")
+        listings.append(listing)
+
+    # Fetch restaurant pages in parallel, results come back in listing order
+    if with_details:
+        restaurant_pages = executor.map(
+            partial(_scrape_restaurant_page, parse_pool=parse_pool), [listing[-1] for listing in listings]
+        )
+    else:
+        restaurant_pages = (_empty_restaurant_page() for _ in listings)
+
+    for (name, city, price, cuisine, rating, restaurant_url), restaurant_page_data in zip(listings, restaurant_pages):
+        restaurant_data["Name"].append(name)
+        restaurant_data["Rating"].append(rating)
+        restaurant_data["City"].append(city)
+        restaurant_data["Price Range"].append(price)
+        restaurant_data["Cuisine"].append(cuisine)
+        restaurant_data["Description"].append(restaurant_page_data['Description'])
+        restaurant_data["Address"].append(restaurant_page_data['Address'])
+        restaurant_data["Latitude"].append(restaurant_page_data['Latitude'])
+        restaurant_data["Longitude"].append(restaurant_page_data['Longitude'])
+        restaurant_data["Michelin Website"].append(restaurant_url)
+        restaurant_data["Restaurant Website"].append(restaurant_page_data['Restaurant Website'])
+        restaurant_data["Restaurant Telephone Number"].append(restaurant_page_data['Telephone Number'])
+        restaurant_data["Reservation Link"].append(restaurant_page_data['Reservation Link'])
+
+    if new_full_url:
+        # CRITICAL CHECK: Only proceed if the new URL is genuinely different
+        if new_full_url != url:
+            next_page_url = new_full_url
+            print(f"\tPotential next URL found: {next_page_url}")
+        else:
+            print("\tNext link points to the current URL. Reached the last page.")
+
+    return _columns_to_frame(restaurant_data), next_page_url, card_count
 
 
 # Main scraper function
-def scrape_michelin_data(start_url: str) -> pd.DataFrame:
+def scrape_michelin_data(
+    start_url: str,
+    blacklist: frozenset = _BLACKLIST,
+    max_workers: int = DETAIL_WORKERS,
+    parse_workers: Optional[int] = None,
+    with_details: bool = True,
+) -> pd.DataFrame:
     """
     Scrapes restaurant data (Name, City, Rating, Address) from all pages
     of a given Michelin Guide URL and returns a Pandas DataFrame.
+    Restaurants whose name is in `blacklist` are skipped, and up to
+    `max_workers` restaurant pages are fetched at once. For very large
+    scrapes, pass `parse_workers` (e.g. os.cpu_count()) to parse pages in
+    a process pool while the threads keep fetching. With `with_details=False`
+    only the results pages are scraped: restaurant pages are not fetched and
+    their columns are left empty.
     """
     print(f"Scraping {start_url}")
 
-    # Define Request Headers once
-    HEADERS = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept-Language': 'en-US,en;q=0.9',
-    }
+    # Drop expired pages so cache lookups below only report fresh hits
+    _SESSION.cache.delete(expired=True)
 
-    all_restaurants_list = []
+    page_dfs: List[pd.DataFrame] = []
     current_url = start_url
     page_count = 1
+    seen_urls: Set[str] = set()
+
+    # One thread pool for all pages, so restaurant pages are fetched with up to max_workers in flight,
+    # plus an optional process pool so HTML parsing doesn't hold up fetching
+    with (
+        ThreadPoolExecutor(max_workers=max_workers) as executor,
+        ProcessPoolExecutor(max_workers=parse_workers) if parse_workers else nullcontext() as parse_pool,
+    ):
+        # Loop as long as a 'current_url' is valid (i.e., we found a next page)
+        while current_url:
+            print(f"\n--- Processing Page {page_count} ---")
+
+            # Use the helper function for the single page scrape
+            page_df, next_url, card_count = _scrape_results_single_page(
+                current_url, executor, seen_urls, blacklist, parse_pool, with_details
+            )
+
+            # Stop on pages without any non-blacklisted cards; a page whose cards were all
+            # already scraped is not the end of the results, so keep following next_url
+            if not card_count and page_count == 1:
+                print("Initial page failed to extract data. Cannot continue.")
+                break
+            elif not card_count:
+                # We assume we have reached an empty page, which can happen at the very end
+                print("Found no data on the last presumed page. Stopping.")
+                break
+
+            if page_df.empty:
+                print("No new restaurants on this page.")
+            else:
+                page_dfs.append(page_df)
 
-    # Loop as long as a 'current_url' is valid (i.e., we found a next page)
-    while current_url:
-        print(f"\n--- Processing Page {page_count} ---")
-
-        # Use the helper function for the single page scrape
-        restaurant_list_on_page, next_url = _scrape_results_single_page(current_url, HEADERS)
-
-        if not restaurant_list_on_page and page_count == 1:
-            print("Initial page failed to extract data. Cannot continue.")
-            break
-        elif not restaurant_list_on_page:
-            # We assume we have reached an empty page, which can happen at the very end
-            print("Found no data on the last presumed page. Stopping.")
-            break
-
-        all_restaurants_list.extend(restaurant_list_on_page)
+            # Update the URL for the next iteration
+            current_url = next_url
+            page_count += 1
 
-        # Update the URL for the next iteration
-        current_url = next_url
-        page_count += 1
+            # CRITICAL: Rate Limiting (skipped when the next page comes from the cache)
+            if current_url:
+                print("Loading next page...")
+                if not _SESSION.cache.contains(url=current_url):
+                    time.sleep(_page_delay())
 
-        # CRITICAL: Rate Limiting
-        if current_url:
-            print("Loading next page...")
-            time.sleep(2)
+    # Stitch the pages together once at the end
+    if page_dfs:
+        df = pd.concat(page_dfs, ignore_index=True, copy=False)
+    else:
+        df = _columns_to_frame(_empty_columns())
 
-    # Convert the final list of dictionaries into a DataFrame
-    df = pd.DataFrame(all_restaurants_list)
+    # Rating and City have few distinct values, so store them as categoricals
+    # (after the concat, which would fall back to object for differing categories)
+    df = df.astype({"Rating": "category", "City": "category"})
     return df
 
 
@@ -270,8 +521,10 @@ if __name__ == "__main__":
 
     # Save outputs
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{CITY_NAME}_Michelin_Guide_{timestamp}.xlsx"
-    results_df.to_excel(os.path.join("/Users/jonathanchow/Downloads", filename), index=False)
+    output_path = os.path.join("/Users/jonathanchow/Downloads", f"{CITY_NAME}_Michelin_Guide_{timestamp}")
+    results_df.to_excel(f"{output_path}.xlsx", index=False, engine='xlsxwriter')
+    # Parquet copy for pipelines that don't need Excel: much smaller and faster to read back
+    results_df.to_parquet(f"{output_path}.parquet", index=False, compression='zstd')
 
     # Timer
     end_time = time.perf_counter()